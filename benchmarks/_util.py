@@ -0,0 +1,13 @@
+"""Helpers shared by the benchmark scripts."""
+
+import time
+
+
+def best_of(fn, repeat=3):
+    """Fastest wall time of ``repeat`` calls of ``fn``, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
@@ -0,0 +1,51 @@
+"""Benchmark: per-row convert_to_seconds vs. vectorized parse_duration_seconds.
+
+Run from the repository root:
+
+    python benchmarks/bench_durations.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from srr.durations import parse_duration_seconds  # noqa: E402
+from _util import best_of  # noqa: E402
+
+
+def convert_to_seconds(time_str):
+    # The per-row parser the pages used before srr.durations
+    if pd.isnull(time_str):
+        return 0
+    try:
+        h, m, s = map(int, time_str.split(':'))
+        return h * 3600 + m * 60 + s
+    except ValueError:
+        return 0
+
+
+def make_durations(n, seed=0):
+    rng = np.random.default_rng(seed)
+    # Mostly minutes-long waits with a long tail, ~10% blanks for open cases
+    seconds = rng.exponential(900, n).astype(int)
+    strings = pd.Series([f"{s // 3600}:{s % 3600 // 60:02d}:{s % 60:02d}" for s in seconds], dtype=object)
+    strings[rng.random(n) < 0.1] = None
+    return strings
+
+
+def main():
+    print(f"{'rows':>10} {'apply (s)':>10} {'vectorized (s)':>15} {'speedup':>8}")
+    for n in (100_000, 1_000_000):
+        values = make_durations(n)
+        assert (values.apply(convert_to_seconds) == parse_duration_seconds(values)).all()
+        old = best_of(lambda: values.apply(convert_to_seconds))
+        new = best_of(lambda: parse_duration_seconds(values))
+        print(f"{n:>10,} {old:>10.3f} {new:>15.3f} {old / new:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
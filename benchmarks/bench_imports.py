@@ -0,0 +1,81 @@
+"""Benchmark: import time of each page before it can paint anything.
+
+A page's top-level imports run before its first ``st.`` call, so on a
+fresh worker they are the floor of its time to first paint.  For every
+page script this runs just those import statements in a fresh process
+(with Streamlit already imported, as it is in a running server) and
+prints the median time over ``--repeat`` runs and which of the heavy
+libraries they pulled in.  The cold import time of each heavy library on
+its own is printed for reference.  Run from the repository root:
+
+    python benchmarks/bench_imports.py [--repeat N]
+"""
+
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGES = [ROOT / '1_Raw_SRR_Data.py', *sorted((ROOT / 'pages').glob('*.py'))]
+HEAVY = ['altair', 'plotly.express', 'plotly.graph_objects', 'st_aggrid', 'streamlit_lottie', 'requests',
+         'streamlit_gsheets', 'pygwalker', 'seaborn', 'matplotlib']
+
+
+def page_imports(path):
+    # The page's top-level import statements, in order
+    tree = ast.parse(path.read_text())
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return ast.unparse(ast.Module(body=nodes, type_ignores=[]))
+
+
+def run(source):
+    sys.path.insert(0, str(ROOT))
+    import streamlit  # noqa: F401
+    preloaded = {name for name in HEAVY if name in sys.modules}
+    started = time.perf_counter()
+    exec(compile(source, '<imports>', 'exec'), {})
+    elapsed = time.perf_counter() - started
+    loaded = [name for name in HEAVY if name in sys.modules and name not in preloaded]
+    print(json.dumps({'seconds': elapsed, 'loaded': loaded}))
+
+
+def measure(source, repeat):
+    results = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, __file__, '--source', source], check=True, capture_output=True,
+                             text=True, cwd=ROOT)
+        results.append(json.loads(out.stdout.splitlines()[-1]))
+    return statistics.median(r['seconds'] for r in results), results[-1]['loaded']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--source', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.source is not None:
+        run(args.source)
+        return
+
+    print(f"{'page':<28} {'imports (ms)':>12}  heavy libraries loaded")
+    for path in PAGES:
+        seconds, loaded = measure(page_imports(path), args.repeat)
+        print(f"{path.name:<28} {seconds * 1000:>12.0f}  {', '.join(loaded) or '-'}")
+    print()
+    print(f"{'library':<28} {'import (ms)':>12}")
+    for name in HEAVY:
+        try:
+            seconds, _ = measure(f'import {name}', args.repeat)
+        except subprocess.CalledProcessError:
+            print(f"{name:<28} {'not installed':>12}")
+            continue
+        print(f"{name:<28} {seconds * 1000:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark: peak memory of a full read vs. srr.ingest's batched read.
+
+Tiles the fixture sheet into a CSV of ``--rows`` rows (default 1,000,000),
+then builds the cube from it in a fresh process each way and prints the
+time and peak RSS of each.  Run from the repository root:
+
+    python benchmarks/bench_ingest.py [--rows N]
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from srr.cube import build_cube  # noqa: E402
+from srr.data import RENAMES, normalize  # noqa: E402
+from srr.ingest import INGEST_COLUMNS, ingest  # noqa: E402
+
+FIXTURE = ROOT / 'fixtures' / 'response_and_survey_form.csv'
+BLOCK_ROWS = 100_000
+
+
+def full(path):
+    # The whole export in one frame, as SheetStore holds the sheet (same columns)
+    return build_cube(normalize(pd.read_csv(path, usecols=lambda col: RENAMES.get(col, col) in INGEST_COLUMNS)))
+
+
+def batched(path):
+    return ingest(path)[0]
+
+
+MODES = {
+    # Interpreter plus the imports above, for reference
+    'imports': lambda path: None,
+    'full': full,
+    'batched': batched,
+}
+
+
+def run(mode, path):
+    started = time.perf_counter()
+    MODES[mode](path)
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    print(f"{mode:>8} {elapsed:>8.2f} {peak:>14.1f}")
+
+
+def write_history(path, rows):
+    # Appended a block at a time: a child process starts with this process's RSS
+    sheet = pd.read_csv(FIXTURE)
+    block = sheet.iloc[np.arange(BLOCK_ROWS) % len(sheet)]
+    sheet.iloc[:0].to_csv(path, index=False)
+    for start in range(0, rows, BLOCK_ROWS):
+        block.iloc[:rows - start].to_csv(path, mode='a', header=False, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.mode:
+        run(args.mode, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'history.csv'
+        write_history(path, args.rows)
+        print(f"{args.rows:,} rows, {path.stat().st_size / 2**20:.0f} MiB CSV")
+        print(f"{'mode':>8} {'time (s)':>8} {'peak RSS (MiB)':>14}")
+        for mode in MODES:
+            subprocess.run([sys.executable, __file__, '--mode', mode, '--path', str(path)], check=True)
+
+
+if __name__ == '__main__':
+    main()
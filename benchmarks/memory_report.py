@@ -0,0 +1,72 @@
+"""Memory report: the SRR frame as object columns vs. with srr.schema applied.
+
+Tiles the fixture sheet up to ``--rows`` rows (default 200,000) and prints
+deep memory usage per column plus groupby / isin timings for both layouts.
+Run from the repository root:
+
+    python benchmarks/memory_report.py [--rows N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from srr.durations import parse_duration_seconds  # noqa: E402
+from srr.schema import apply_schema  # noqa: E402
+from _util import best_of  # noqa: E402
+
+FIXTURE = ROOT / 'fixtures' / 'response_and_survey_form.csv'
+
+
+def load_untyped(rows):
+    sheet = pd.read_csv(FIXTURE, dtype=object)
+    df = sheet.iloc[np.arange(rows) % len(sheet)].reset_index(drop=True)
+    df = df.rename(columns={'In process (On It SME)': 'SME (On It)'})
+    df['Date Created'] = pd.to_datetime(df['Date Created'], errors='coerce')
+    df['Hour_Created'] = pd.to_numeric(df['Hour_Created'])
+    df['Survey'] = pd.to_numeric(df['Survey'])
+    df['TimeTo: On It Sec'] = parse_duration_seconds(df['TimeTo: On It'])
+    df['TimeTo: Attended Sec'] = parse_duration_seconds(df['TimeTo: Attended'])
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    args = parser.parse_args()
+
+    before = load_untyped(args.rows)
+    after = apply_schema(before)
+
+    usage = pd.DataFrame({
+        'before (KiB)': before.memory_usage(deep=True, index=False) / 1024,
+        'after (KiB)': after.memory_usage(deep=True, index=False) / 1024,
+        'dtype': after.dtypes.astype(str),
+    })
+    pd.set_option('display.width', 120)
+    print(usage.round(1).sort_values('before (KiB)', ascending=False).to_string())
+    total_before = usage['before (KiB)'].sum() / 1024
+    total_after = usage['after (KiB)'].sum() / 1024
+    print(f"\n{args.rows:,} rows: {total_before:.1f} MiB -> {total_after:.1f} MiB "
+          f"({total_before / total_after:.1f}x smaller)\n")
+
+    services = list(before['Service'].dropna().unique()[:2])
+    cases = {
+        'groupby Service/SME mean': lambda df: df.groupby(['Service', 'SME (On It)'], observed=True)['TimeTo: On It Sec'].mean(),
+        'Service isin': lambda df: df['Service'].isin(services),
+        'Status == In Queue': lambda df: df['Status'] == 'In Queue',
+    }
+    for name, fn in cases.items():
+        old = best_of(lambda: fn(before), repeat=5)
+        new = best_of(lambda: fn(after), repeat=5)
+        print(f"{name:<28} {old * 1000:8.2f} ms -> {new * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+import streamlit as st
+from srr.live import live_status, show_live
+
+
+st.set_page_config(page_title="Live Queue", page_icon=":rotating_light:", layout="wide")
+
+# ?format=json shows the counts and rows as a JSON tree instead of the view;
+# it is only viewable in the page, not fetchable by scripts
+if st.query_params.get('format') == 'json':
+    st.json(live_status())
+else:
+    st.markdown(
+        f"<h1 style='text-align: center;'>Live Queue</h1>",
+        unsafe_allow_html=True
+    )
+    show_live()
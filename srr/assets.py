@@ -0,0 +1,121 @@
+"""Lottie animations used by the dashboards.
+
+The animations are read from ``assets/lottie/<name>.json`` once per process.
+``lottie.host`` is only a fallback: a missing animation is downloaded on a
+background thread, with a short timeout, and written to the assets folder
+for the next process.  The page does not wait for it: the animation shows
+from the first rerun after the download.  A failed download is not
+remembered past ``RETRY_AFTER`` seconds, and just means the page renders
+without that animation.
+``requests`` and ``streamlit_lottie`` are only imported when needed.
+
+Vendor all of them up front with::
+
+    python -m srr.assets
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import streamlit as st
+
+
+log = logging.getLogger(__name__)
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / 'assets' / 'lottie'
+FETCH_TIMEOUT = 5  # seconds
+RETRY_AFTER = 300  # seconds before a failed download is tried again
+
+LOTTIE_URLS = {
+    'people': "https://lottie.host/2ad92c27-a3c0-47cc-8882-9eb531ee1e0c/A9tbMxONxp.json",
+    'clap': "https://lottie.host/af0a6ccc-a8ac-4921-8564-5769d8e09d1e/4Czx1gna6U.json",
+    'queuing': "https://lottie.host/910429d2-a0a4-4668-a4d4-ee831f9ccecd/yOKbdL2Yze.json",
+    'inprogress': "https://lottie.host/c5c6caea-922b-4b4e-b34a-41ecaafe2a13/mphMkSfOkR.json",
+    'chill': "https://lottie.host/2acdde4d-32d7-44a8-aa64-03e1aa191466/8EG5a8ToOQ.json",
+}
+
+_fetcher = ThreadPoolExecutor(max_workers=len(LOTTIE_URLS), thread_name_prefix='srr-lottie')
+_fetch_lock = threading.Lock()
+# name -> (future of _fetch, monotonic time it was started)
+_fetches = {}
+
+
+class LottieUnavailable(Exception):
+    """The animation is not on disk and not (yet) downloaded."""
+
+
+def _fetch(name):
+    import requests
+
+    try:
+        r = requests.get(LOTTIE_URLS[name], timeout=FETCH_TIMEOUT)
+        r.raise_for_status()
+        animation = r.json()
+    except (requests.RequestException, ValueError) as exc:
+        log.warning("Could not fetch lottie animation %r: %s", name, exc)
+        raise LottieUnavailable(name) from exc
+    try:
+        ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+        (ASSETS_DIR / f"{name}.json").write_text(json.dumps(animation))
+    except OSError as exc:
+        log.warning("Could not vendor lottie animation %r: %s", name, exc)
+    return animation
+
+
+def _fetch_in_background(name):
+    """Future of the download of ``name``, started once and again after a failure."""
+    with _fetch_lock:
+        entry = _fetches.get(name)
+        if entry is None or (entry[0].done() and entry[0].exception() is not None
+                             and time.monotonic() - entry[1] >= RETRY_AFTER):
+            entry = (_fetcher.submit(_fetch, name), time.monotonic())
+            _fetches[name] = entry
+        return entry[0]
+
+
+@st.cache_resource(show_spinner=False)
+def load_lottie(name):
+    """Return the animation JSON for ``name``.
+
+    Raises ``LottieUnavailable`` (which is not cached) while it is neither
+    on disk nor downloaded.
+    """
+    path = ASSETS_DIR / f"{name}.json"
+    if path.exists():
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError) as exc:
+            log.warning("Ignoring unreadable lottie asset %s: %s", path, exc)
+    future = _fetch_in_background(name)
+    if not future.done():
+        raise LottieUnavailable(name)
+    return future.result()
+
+
+def show_lottie(name, **kwargs):
+    """``st_lottie`` for a named animation; renders nothing if it is missing."""
+    try:
+        animation = load_lottie(name)
+    except LottieUnavailable:
+        return
+    from streamlit_lottie import st_lottie
+
+    st_lottie(animation, **kwargs)
+
+
+if __name__ == '__main__':
+    failed = []
+    for name in LOTTIE_URLS:
+        try:
+            _fetch(name)
+        except LottieUnavailable:
+            failed.append(name)
+            print(name, 'FAILED')
+        else:
+            print(name, 'ok')
+    # Non-zero so a build step that vendors the animations fails loudly
+    raise SystemExit(1 if failed else 0)
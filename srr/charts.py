@@ -0,0 +1,182 @@
+"""Chart builders for the dashboards, memoized per data version and filters.
+
+Every builder takes small pre-aggregated frames (roll-ups of the cube),
+never raw rows, so a chart's payload does not grow with the history.
+``cached`` keeps the built chart for each (chart, key) pair, where the key
+the dashboard passes is (data version, partition, Service, Month): a rerun
+on unchanged data with unchanged filters builds nothing.
+
+Plotly builders return figures; Altair builders return the Vega-Lite spec
+dict (``chart.to_dict()``, which is where Altair spends its time), to be
+shown with ``st.vega_lite_chart``.
+
+Altair and Plotly are imported by the builders, not at module import: a
+page paints before the first chart is built, and a rerun served from
+``cached`` never loads them.
+"""
+
+import streamlit as st
+
+from srr.metrics import cache_miss, section
+
+
+MONTH_ORDER = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
+
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _cached(name, key, _build):
+    cache_miss()
+    return _build()
+
+
+def cached(name, key, _build):
+    """``_build()``, memoized on ``(name, key)``. Callers must not mutate the result."""
+    with section(f'charts.{name}', cached=True):
+        return _cached(name, key, _build)
+
+
+def hourly_by_service(agg_hour_service):
+    """Stacked bar of interactions by hour and Service, with a total label per hour.
+
+    ``agg_hour_service`` has 'Hour_Created', one column per Service and 'Total'.
+    """
+    import plotly.express as px
+
+    services = agg_hour_service.columns[1:-1]
+    fig = px.bar(agg_hour_service, x='Hour_Created', y=services, title='Hourly Interactions by Service',
+                labels={'value': 'Interactions', 'Hour_Created': 'Hour of Creation'},
+                category_orders={'Service': services})
+    fig.update_layout(barmode='stack')
+
+    # Add data labels with total counts
+    return add_totals(fig, agg_hour_service['Hour_Created'], agg_hour_service['Total'])
+
+
+def add_totals(fig, x, totals):
+    """Label each stacked bar of ``fig`` with its total.
+
+    All labels go in one text trace; an ``add_annotation`` per bar
+    re-validates the layout every time.
+    """
+    import plotly.graph_objects as go
+
+    fig.add_trace(go.Scatter(
+        x=x, y=totals, text=totals.astype(str), mode='text',
+        textposition='top center',  # just above the bar
+        textfont=dict(color='black', size=10),
+        showlegend=False, hoverinfo='skip',
+    ))
+    return fig
+
+
+def on_it_by_hour(agg_hour_on_it):
+    import plotly.express as px
+
+    # Line chart of the average 'TimeTo: On It' in minutes by "Hour_Created"
+    return px.line(agg_hour_on_it, x='Hour_Created', y='TimeTo: On It Minutes', title='Average Timeto: On It By The Hour')
+
+
+def case_reason_by_hour(pivot_table):
+    import plotly.express as px
+
+    fig = px.bar(pivot_table, x=pivot_table.index, y=pivot_table.columns, barmode='stack', title='Case Reason Distribution by Hour')
+
+    # Customize the layout
+    fig.update_layout(
+        xaxis_title='Hour',
+        yaxis_title='Count',
+        legend_title='Case Reason',
+        xaxis=dict(tickangle=0),
+    )
+    return fig
+
+
+def case_reason_pie(case_counts):
+    import plotly.express as px
+
+    return px.pie(case_counts, values='Service', names='Case Reason', title='Distribution of Case Reasons', hole=0.5)
+
+
+def response_times(agg_long, by, title):
+    """Stacked On It / Attended minutes by ``by`` ('Month' or 'Service')."""
+    import altair as alt
+
+    chart = alt.Chart(agg_long).mark_bar().encode(
+        # Months in calendar order
+        x=alt.X(by, sort=MONTH_ORDER) if by == 'Month' else by,
+        y=alt.Y('Minutes', stack='zero'),  # Use stack='zero' for stacking
+        color='Category',  # Color distinguishes the categories
+        tooltip=[by, 'Category', 'Minutes']  # Optional: add tooltip for interactivity
+    ).properties(
+        title=title,
+        width=600,
+        height=400
+    )
+    return chart.to_dict()
+
+
+def interaction_count(service_counts):
+    """Bar of interactions per Service; ``service_counts`` has 'Service' and 'Count'."""
+    import altair as alt
+
+    chart = alt.Chart(service_counts).mark_bar().encode(
+        x='Service',
+        y='Count',
+        tooltip=['Service', 'Count']
+    ).properties(
+        title='Interaction Count',
+        width=600,
+        height=600
+    )
+    return chart.to_dict()
+
+
+def interactions_handled(sme_counts):
+    """Bar of interactions per SME; ``sme_counts`` has 'SME (On It)' and 'Count'."""
+    import altair as alt
+
+    chart = alt.Chart(sme_counts).mark_bar().encode(
+        y=alt.Y('SME (On It):N', sort='-x'),  # Sorting based on the count in descending order, ensure to specify ':N' for nominal data
+        x=alt.X('Count:Q', title='Unique Case Count'),
+        tooltip=['SME (On It)', 'Count']
+    ).properties(
+        title='Interactions Handled',
+        width=600,
+        height=600
+    )
+    return chart.to_dict()
+
+
+def sme_on_it(df_sorted):
+    import altair as alt
+
+    chart = alt.Chart(df_sorted).mark_bar().encode(
+        x=alt.X('SME', title='SME', sort='-y'),
+        y=alt.Y('Avg_On_It_Min:Q', title='Average Time On It (Minutes)'),
+        color=alt.condition(
+            alt.datum.Avg_On_It_Min > 5,
+            alt.value('red'),
+            alt.value('steelblue')
+        ),
+        tooltip=['SME', alt.Tooltip('Avg_On_It_Min:Q', title='Average Time On It (Minutes)')]
+    ).properties(
+        width=600,
+        height=400,
+        title='Average Time On It by SME'
+    )
+    return chart.to_dict()
+
+
+def sme_attended(df_sorted):
+    import altair as alt
+
+    chart = alt.Chart(df_sorted).mark_bar().encode(
+        x=alt.X('SME', title='SME', sort='-y'),
+        y=alt.Y('Avg_Attended_Min:Q', title='Average Time Attended (Minutes)'),
+        tooltip=['SME', alt.Tooltip('Avg_Attended_Min:Q', title='Average Time Attended (Minutes)')]
+    ).properties(
+        width=600,
+        height=400,
+        title='Average Time Attended by SME'
+    )
+    return chart.to_dict()
@@ -0,0 +1,104 @@
+"""Correlation matrix of the analytics frame and its heatmap.
+
+The seaborn heatmap took seconds to draw and ``perform_eda`` drew it again
+on every widget change.  The matrix and the PNG are now computed once per
+data version.  The PNG is drawn on a worker thread with a pyplot-free
+matplotlib ``Figure`` (pyplot's global state is not thread safe), so the
+page shows the rest of the EDA while it renders; ``show_heatmap`` polls
+for it in a fragment.  A failed render is evicted from the cache, so it
+is tried again instead of sticking to the data version.  An interactive Plotly heatmap of the same matrix is
+offered as a lighter alternative.
+"""
+
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import streamlit as st
+
+
+log = logging.getLogger(__name__)
+
+_renderer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='srr-heatmap')
+
+
+def correlation(frame):
+    numerical_columns = frame.select_dtypes(include=np.number).columns
+    return frame[numerical_columns].corr()
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_correlation(version, _frame):
+    """``correlation`` of ``_frame``, computed once per data version."""
+    return correlation(_frame)
+
+
+def render_png(correlation_matrix):
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 10))
+    ax = fig.subplots()
+    sns.heatmap(correlation_matrix, annot=True, cmap="coolwarm", vmin=-1, vmax=1, ax=ax)
+    ax.set_title("Correlation Matrix")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight')
+    return buffer.getvalue()
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def heatmap_png(version, _correlation_matrix):
+    """Future of the PNG heatmap for a data version, rendered off the request path."""
+    return _renderer.submit(render_png, _correlation_matrix)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def heatmap_figure(version, _correlation_matrix):
+    import plotly.express as px
+
+    return px.imshow(_correlation_matrix, text_auto='.2f', color_continuous_scale='RdBu_r', zmin=-1, zmax=1,
+                     title="Correlation Matrix")
+
+
+def _show_png(version, correlation_matrix, future):
+    # Returns whether the image was shown; after a failure the caller reruns
+    exc = future.exception()
+    if exc is None:
+        st.image(future.result())
+        return True
+    # The cached future would hold the error for the whole data version
+    heatmap_png.clear(version, correlation_matrix)
+    log.warning("Rendering the correlation heatmap failed: %s", exc)
+    st.session_state['heatmap_failed'] = version
+    return False
+
+
+@st.fragment(run_every=1)
+def _poll_png(version, correlation_matrix, future):
+    if future.done():
+        _show_png(version, correlation_matrix, future)
+        # Stop polling
+        st.rerun()
+    else:
+        st.caption("Rendering correlation heatmap...")
+
+
+def show_heatmap(version, frame):
+    correlation_matrix = load_correlation(version, frame)
+    interactive = st.toggle("Interactive heatmap", key='interactive_heatmap')
+    if interactive:
+        st.plotly_chart(heatmap_figure(version, correlation_matrix), use_container_width=True)
+        return
+    # Retried on request rather than on every rerun
+    if st.session_state.get('heatmap_failed') == version:
+        st.warning("Could not render the correlation heatmap.")
+        if not st.button("Retry heatmap"):
+            return
+        del st.session_state['heatmap_failed']
+    future = heatmap_png(version, correlation_matrix)
+    if future.done():
+        if not _show_png(version, correlation_matrix, future):
+            st.rerun()
+    else:
+        _poll_png(version, correlation_matrix, future)
@@ -0,0 +1,396 @@
+"""The SRR management dashboard, shared by the Raw / Working Hours / Off Hours pages.
+
+Those pages used to be three near-identical scripts that each cached their
+own filtered copy of the sheet.  They now call ``render_dashboard`` with a
+partition predicate: a function taking a frame (the raw rows or the cube)
+and returning a boolean mask over it.  Every page reads the one shared
+frame from ``srr.data`` and the one cube from ``srr.cube``; partitions and
+the Service/Month filters are applied as masks when a section needs them.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from srr.assets import show_lottie
+from srr import charts
+from srr.charts import cached
+from srr.cube import counts, load_versioned_cube, mean_seconds, sme_summary, totals
+from srr.data import REFRESH_TTL, SHEET_COLUMNS, declare_columns, get_store, load_sheet, with_heavy_columns
+from srr.durations import format_hms, seconds_to_hms
+from srr.exports import FORMATS, download_button
+from srr.live import load_open, queues
+from srr.metrics import section, timed
+from srr.schema import flags_as_text
+from srr.tables import paged_table
+
+
+FILTERED_COLUMNS = ['Case #', 'Service', 'Inquiry', 'Requestor', 'Creation Timestamp',
+       'SME (On It)', 'On It Time', 'Attendee', 'Attended Timestamp',
+       'Message Link', 'Message Link 0', 'Message Link 1', 'Message Link 2',
+       'Status', 'Case Reason', 'AFI', 'AFI Comment', 'Article#',
+       'TimeTo: On It', 'TimeTo: Attended','Month', 'Day', 'Weekend?',
+       'Date Created', 'Working Hours?', 'Survey', 'Hour_Created']
+# The Data table labels the duration strings as the raw values they are
+RAW_LABELS = {'TimeTo: On It': 'TimeTo: On It (Raw)', 'TimeTo: Attended': 'TimeTo: Attended (Raw)'}
+
+# The open-case sections filter on these too
+declare_columns('open_cases', ['Working Hours?', 'Service', 'Month'])
+# The Data table shows every sheet column; the heavy ones are joined in when it is opened
+declare_columns('data_table', SHEET_COLUMNS)
+
+
+# 'Working Hours?' is a nullable boolean; blanks belong to neither partition
+def working_hours(frame):
+    return frame['Working Hours?'].eq(True).fillna(False)
+
+
+def off_hours(frame):
+    return frame['Working Hours?'].eq(False).fillna(False)
+
+
+def select(frame, partition=None, service='All', month='All'):
+    """Apply the page partition and the Service/Month filters to ``frame``."""
+    if partition is not None:
+        frame = frame[partition(frame)]
+    if service != 'All':
+        frame = frame[frame['Service'] == service]
+    if month != 'All':
+        frame = frame[frame['Month'] == month]
+    return frame
+
+
+@timed('dashboard.render')
+def render_dashboard(subtitle=None, partition=None, show_filters=True):
+    cube, version = load_versioned_cube()
+    cube = select(cube, partition)
+
+    # Button to refresh the data - align to upper right
+    col1, col2 = st.columns([3, .350])
+    with col2:
+        if st.button('Refresh Data'):
+            # Re-read the whole sheet, as the refresh always did: edits to closed rows included
+            get_store().invalidate(full=True)
+            st.cache_data.clear()
+            st.rerun()
+
+    # Center align 'five9 srr agent view'
+    st.markdown(
+        f"<h1 style='text-align: center;'>Five9 SRR Management View</h1>",
+        unsafe_allow_html=True
+    )
+
+    if subtitle:
+        st.markdown(
+            f"<h3 style='text-align: center;'>{subtitle}</h3>",
+            unsafe_allow_html=True
+        )
+
+    selected_service = selected_month = 'All'
+    if show_filters:
+        cols1, cols2, cols3 = st.columns(3)
+        with cols1:
+            # Display Lottie animation
+            show_lottie('people', speed=1, reverse=False, loop=True, quality="low", height=200, width=200, key=None)
+        with cols2:
+            selected_service = st.selectbox('Service', ['All'] + list(cube['Service'].unique()))
+        with cols3:
+            months = select(cube, service=selected_service)['Month'].unique()
+            selected_month = st.selectbox('Month', ['All'] + list(months))
+    else:
+        # Display Lottie animation
+        show_lottie('people', speed=1, reverse=False, loop=True, quality="low", height=200, width=200, key=None)
+
+    cube_filtered = select(cube, service=selected_service, month=selected_month)
+    # Identifies the filtered views for the export cache
+    filters = (getattr(partition, '__name__', None), selected_service, selected_month)
+    # ...and, with the data version, for the memoized tables and charts
+    key = (version,) + filters
+
+    st.write(':wave: Welcome:exclamation:')
+
+    show_metrics(cube_filtered)
+    show_open_cases(partition, selected_service, selected_month)
+    show_data(partition, selected_service, selected_month)
+    st.markdown("---")
+    show_hourly(cube_filtered, filters, key)
+    show_breakdowns(cube_filtered, key)
+    show_requestor_pivot(cube_filtered, filters, key)
+    st.divider()
+    show_sme_summary(cube_filtered, key)
+
+
+def show_metrics(cube):
+    total = totals(cube)
+    overall_avg_on_it_hms = seconds_to_hms(total['on_it_sec'] / total['on_it_n'] if total['on_it_n'] else float('nan'))
+    overall_avg_attended_hms = seconds_to_hms(total['attended_sec'] / total['attended_n'] if total['attended_n'] else float('nan'))
+    survey_avg = total['survey'] / total['survey_n'] if total['survey_n'] else float('nan')
+
+    # Display metrics
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric(label="Interactions", value=int(total['n']))
+    with col2:
+        st.metric(label="Survey Avg.", value=f"{survey_avg:.2f}")
+    with col3:
+        st.metric(label="Answered Surveys", value=int(total['survey_n']))
+    with col4:
+        st.metric("Overall Avg. TimeTo: On It", overall_avg_on_it_hms)
+    with col5:
+        st.metric("Overall Avg. TimeTo: Attended", overall_avg_attended_hms)
+
+
+# The open cases are the only part of the page that changes minute to minute, so
+# instead of sleeping and rerunning the whole script this fragment alone re-runs on a timer
+@st.fragment(run_every=REFRESH_TTL)
+def show_open_cases(partition, selected_service, selected_month):
+    # Only the open cases, kept apart by the store; no pass over the history
+    df_live = select(load_open(), partition, selected_service, selected_month)
+
+    # DataFrames for "In Queue" and "In Progress"
+    df_inqueue, df_inprogress = queues(df_live)
+
+    # Display "In Queue" DataFrame with count and some text
+    in_queue_count = len(df_inqueue)
+
+    # Using columns to place text and animation side by side
+    col1, col2 = st.columns([0.3, 1.2])  # Adjust the ratio as needed for your layout
+    with col1:
+        st.title(f'In Queue ({in_queue_count})')
+    with col2:
+        # Clapping when the queue is empty
+        show_lottie('clap' if in_queue_count == 0 else 'queuing', speed=1, height=100, width=200)
+    with st.expander("Show Data", expanded=False):
+        st.dataframe(df_inqueue, use_container_width=True)
+
+    # Display "In Progress" DataFrame with count
+    in_progress_count = len(df_inprogress)
+    col1, col2 = st.columns([0.4, 1.2])  # Adjust the ratio as needed for your layout
+    with col1:
+        st.title(f'In Progress ({in_progress_count})')
+    with col2:
+        show_lottie('chill' if in_progress_count == 0 else 'inprogress', speed=1, height=100, width=200)
+    with st.expander("Show Data", expanded=False):
+        st.dataframe(df_inprogress, use_container_width=True)
+
+
+def show_data(partition, selected_service, selected_month):
+    # Display the filtered dataframe
+    st.title('Data')
+    # on_change='rerun' makes .open reflect the expander, so nothing is built while it is closed
+    expander = st.expander('Show Data', expanded=False, key='show_data', on_change='rerun')
+    with expander:
+        if expander.open:
+            df_filtered = select(load_sheet(), partition, selected_service, selected_month)
+            # Only the visible page is sent to the browser; the heavy columns are joined for its rows,
+            # and for every row only while a search or a sort on them needs it
+            with section('dashboard.data_table', rows=len(df_filtered)):
+                paged_table(df_filtered[[col for col in FILTERED_COLUMNS if col in df_filtered]], key='data_table',
+                            render=raw_view, expand=with_heavy_columns)
+
+            # Every row of the sheet, whatever the page and filters
+            col1, col2 = st.columns([0.5, 2])
+            with col1:
+                fmt = st.selectbox('Format', list(FORMATS), key='raw_export_format')
+            with col2:
+                download_button('Download All Data',
+                                lambda: raw_view(load_sheet()),
+                                file_name='srr_raw_data', view='raw', fmt=fmt,
+                                help="Download every row of the SRR sheet")
+
+
+def raw_view(frame):
+    # The rows as the sheet has them: Yes/No flags, the duration strings labelled raw
+    return flags_as_text(with_heavy_columns(frame)[FILTERED_COLUMNS]).rename(columns=RAW_LABELS)
+
+
+def hourly_tables(cube):
+    # Stacked counts of "Service" by "Hour_Created", with the sum of counts for each hour to use as data labels
+    agg_hour_service = counts(cube, 'Hour_Created', 'Service').reset_index()
+    agg_hour_service['Total'] = agg_hour_service.iloc[:, 1:].sum(axis=1)
+
+    # Average 'TimeTo: On It' by "Hour_Created", in minutes and in "hh:mm:ss" format
+    agg_hour_on_it = mean_seconds(cube, 'Hour_Created').drop(columns='TimeTo: Attended Sec')
+    agg_hour_on_it['TimeTo: On It Minutes'] = agg_hour_on_it['TimeTo: On It Sec'] / 60
+    agg_hour_on_it['TimeTo: On It HH:MM:SS'] = format_hms(agg_hour_on_it['TimeTo: On It Sec'])
+    return agg_hour_service, agg_hour_on_it
+
+
+def show_hourly(cube, filters, key):
+    agg_hour_service, agg_hour_on_it = cached('hourly_tables', key, lambda: hourly_tables(cube))
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Create a bar chart showing the stacked counts of "Service" by "Hour_Created"
+        fig = cached('hourly_by_service', key, lambda: charts.hourly_by_service(agg_hour_service))
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Show the data in a collapsible table
+        with st.expander("Show Data", expanded=False):
+            st.dataframe(agg_hour_service, use_container_width=True)
+            # Download button
+            download_button('Download Data', agg_hour_service, file_name='hourly_interactions_by_service',
+                            view='hourly_interactions_by_service', filters=filters,
+                            help="Click to download the Hourly Interactions by Service in CSV format")
+
+    with col2:
+        # Create a line chart that would show the average 'TimeTo: On It' in minutes by "Hour_Created"
+        fig = cached('on_it_by_hour', key, lambda: charts.on_it_by_hour(agg_hour_on_it))
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Show the data in a collapsible table
+        with st.expander("Show Data", expanded=False):
+            st.dataframe(agg_hour_on_it[['Hour_Created', 'TimeTo: On It HH:MM:SS']], use_container_width=True)
+            # Download button
+            download_button('Download Data', agg_hour_on_it, file_name='average_time_to_on_it',
+                            view='average_time_to_on_it', filters=filters,
+                            help="Click to download the Average Time to On It by Hour in CSV format")
+
+
+def breakdown_tables(cube):
+    tables = {}
+    tables['case_reason_by_hour'] = counts(cube, 'Hour_Created', 'Case Reason')
+
+    # Count interactions by "Case Reason", sorted by counts in ascending order
+    case_counts = counts(cube, 'Case Reason').rename('Service').reset_index()
+    tables['case_counts'] = case_counts.sort_values(by='Service', ascending=True)
+
+    # Mean 'TimeTo: Attended Sec' and 'TimeTo: On It Sec' by 'Case Reason', in a readable time format
+    by_case_reason = mean_seconds(cube, 'Case Reason')
+    avg_attended = by_case_reason.sort_values(by='TimeTo: Attended Sec', ascending=False)
+    tables['avg_attended_by_case_reason'] = pd.DataFrame({
+        'Case Reason': avg_attended['Case Reason'],
+        'Avg TimeTo: Attended': format_hms(avg_attended['TimeTo: Attended Sec']),
+    }).reset_index(drop=True)
+    avg_on_it = by_case_reason.sort_values(by='TimeTo: On It Sec', ascending=False)
+    tables['avg_on_it_by_case_reason'] = pd.DataFrame({
+        'Case Reason': avg_on_it['Case Reason'],
+        'Avg TimeTo: On It': format_hms(avg_on_it['TimeTo: On It Sec']),
+    }).reset_index(drop=True)
+
+    # Monthly and per-service means in minutes, with column names Altair can use
+    for by in ['Month', 'Service']:
+        agg = mean_seconds(cube, by)
+        agg['TimeTo_On_It_Minutes'] = agg['TimeTo: On It Sec'] / 60
+        agg['TimeTo_Attended_Minutes'] = agg['TimeTo: Attended Sec'] / 60
+        tables[f'agg_{by.lower()}_long'] = agg.melt(id_vars=[by],
+                                                    value_vars=['TimeTo_On_It_Minutes', 'TimeTo_Attended_Minutes'],
+                                                    var_name='Category',
+                                                    value_name='Minutes')
+
+    # Interaction counts per 'Service' and per 'SME (On It)'
+    tables['service_counts'] = counts(cube, 'Service').rename('Count').reset_index()
+    tables['sme_counts'] = counts(cube, 'SME (On It)').rename('Count').reset_index()
+    return tables
+
+
+def show_breakdowns(cube, key):
+    tables = cached('breakdown_tables', key, lambda: breakdown_tables(cube))
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Create the stacked bar chart
+        st.plotly_chart(cached('case_reason_by_hour', key, lambda: charts.case_reason_by_hour(tables['case_reason_by_hour'])),
+                        use_container_width=True)
+
+    with col2:
+        # Generate a pie chart
+        st.plotly_chart(cached('case_reason_pie', key, lambda: charts.case_reason_pie(tables['case_counts'])))
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader('Average TimeTo: Attended by Case Reason')
+        st.dataframe(tables['avg_attended_by_case_reason'], use_container_width=True)
+
+    with col2:
+        st.subheader('Average TimeTo: On It by Case Reason')
+        st.dataframe(tables['avg_on_it_by_case_reason'], use_container_width=True)
+
+    col1, col5 = st.columns(2)
+
+    # Stacked bar charts of monthly and per-group response times
+    with col1:
+        st.vega_lite_chart(cached('monthly_response_times', key,
+                                  lambda: charts.response_times(tables['agg_month_long'], 'Month', 'Monthly Response Times')))
+
+    with col5:
+        st.vega_lite_chart(cached('group_response_times', key,
+                                  lambda: charts.response_times(tables['agg_service_long'], 'Service', 'Group Response Times')))
+
+    # Interactive bar charts of the 'unique case count' for each 'Service' and each 'SME (On It)',
+    # drawn from the counts rather than from every row
+    with col1:
+        st.vega_lite_chart(cached('interaction_count', key, lambda: charts.interaction_count(tables['service_counts'])))
+
+    with col5:
+        st.vega_lite_chart(cached('interactions_handled', key, lambda: charts.interactions_handled(tables['sme_counts'])))
+
+
+def requestor_table(cube):
+    # st_aggrid is only needed here; importing it at the top delayed every page's first paint
+    from st_aggrid import GridOptionsBuilder
+
+    # Rows are the 'Requestor', columns the 'Service', values the count of each 'Service'
+    pivot_df = counts(cube, 'Requestor', 'Service').reset_index()
+
+    # Setting up GridOptions for AgGrid; paging, search and sort happen server side in paged_table.
+    # No row grouping: the grid only holds one page, so its group sums would cover that page alone
+    gb = GridOptionsBuilder.from_dataframe(pivot_df)
+    gb.configure_default_column(editable=False)
+    return pivot_df, gb.build()
+
+
+def show_requestor_pivot(cube, filters, key):
+    from st_aggrid import AgGrid, GridUpdateMode
+
+    st.subheader('Interaction Count by Requestor')
+
+    pivot_df, gridOptions = cached('requestor_pivot', key, lambda: requestor_table(cube))
+
+    # Display the AgGrid component with the configured options, one page of requestors at a time
+    with section('dashboard.requestor_pivot', rows=len(pivot_df)):
+        paged_table(pivot_df, key='requestor_pivot', page_size=10,
+                    show=lambda rows: AgGrid(rows, gridOptions=gridOptions, update_mode=GridUpdateMode.NO_UPDATE,
+                                             fit_columns_on_grid_load=True, key='requestor_pivot_grid'))
+
+    # Create an download button to download the pivot_df to CSV
+    download_button('Download Data', pivot_df, file_name='interaction_count_by_requestor',
+                    view='interaction_count_by_requestor', filters=filters,
+                    help="Download Interaction Count by Requestor Data in CSV format")
+
+
+def sme_table(cube):
+    # Creating the Summary Table where it sorts the SME (On It) column by first getting the total average TimeTo: On It and average TimeTo: Attended and then sorting it by the number of Interactions
+    # and then by the highest average survey.
+    df_grouped = sme_summary(cube)
+
+    df_grouped['Total_Avg_Sec'] = df_grouped['Avg_On_It_Sec'] + df_grouped['Avg_Attended_Sec']
+
+    # Sort by Total_Avg_Sec, Number_of_Interactions, and then by Avg_Survey in descending order
+    df_sorted = df_grouped.sort_values(by=['Total_Avg_Sec', 'Number_of_Interactions', 'Avg_Survey'], ascending=[True, False, False])
+
+    df_sorted['Avg_On_It'] = format_hms(df_sorted['Avg_On_It_Sec'])
+    df_sorted['Avg_Attended'] = format_hms(df_sorted['Avg_Attended_Sec'])
+
+    # Convert the 'Avg_On_It_Sec' and 'Avg_Attended_Sec' columns to minutes
+    df_sorted['Avg_On_It_Min'] = df_sorted['Avg_On_It_Sec'] / 60
+    df_sorted['Avg_Attended_Min'] = df_sorted['Avg_Attended_Sec'] / 60
+
+    # Rename 'SME (On It)' column to 'SME'
+    return df_sorted.rename(columns={'SME (On It)': 'SME'}).reset_index(drop=True)
+
+
+def show_sme_summary(cube, key):
+    df_sorted = cached('sme_table', key, lambda: sme_table(cube))
+
+    # Display "Summary Table"
+    st.subheader('SME Summary Table')
+    st.dataframe(df_sorted[['SME', 'Avg_On_It', 'Avg_Attended', 'Number_of_Interactions', 'Avg_Survey']])
+
+    st.markdown(":arrow_up: 5 minutes = :red[red]")
+
+    # Display the Average Time On It and Average Time Attended charts
+    st.vega_lite_chart(cached('sme_on_it', key, lambda: charts.sme_on_it(df_sorted)), use_container_width=True)
+    st.vega_lite_chart(cached('sme_attended', key, lambda: charts.sme_attended(df_sorted)), use_container_width=True)
@@ -0,0 +1,451 @@
+"""Process-wide access to the "Response and Survey Form" worksheet.
+
+Every page used to call ``conn.read`` on its own at the top of the script,
+so each open tab paid for a Google Sheets round trip on every rerun.  The
+store below is created once per server process (``st.cache_resource``) and
+shared by all pages and sessions: the sheet is fetched at most once per
+``REFRESH_TTL`` seconds, and concurrent reruns that find the data stale wait
+on a single in-flight fetch instead of starting their own.
+
+The sheet is append-only, so after the first full read the store only asks
+for the rows from the oldest still-open case onwards (see ``SheetStore``).
+A refresh that brings back the same content (see ``fingerprint``) does not
+publish a new version, so everything cached on the version stays valid.
+
+Only the columns some view has declared with ``declare_columns`` are read.
+The long free-text columns in ``HEAVY_COLUMNS`` are never part of that
+projection; ``with_heavy_columns`` fetches them on demand.
+
+Set ``SRR_FIXTURE`` to the path of a CSV export of the worksheet to run the
+dashboards offline against that file instead of Google Sheets.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from srr.durations import parse_duration_seconds
+from srr.metrics import cache_miss, section, timed
+from srr.schema import apply_schema, concat_frames
+from srr.snapshot import SNAPSHOT_DIR, SNAPSHOT_PATH, load_snapshot, save_snapshot
+
+
+log = logging.getLogger(__name__)
+
+# The frame is shared by every session, so selections, renames and assigns
+# must not copy it, and writes through them must not reach it: copy-on-write
+# gives both.  It is always on from pandas 3.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+
+WORKSHEET = "Response and Survey Form"
+REFRESH_TTL = 120  # seconds between upstream reads
+# Incremental reads skip closed rows; re-read everything at least this often
+# so edits to old rows (Survey, Case Reason, AFI...) are picked up
+FULL_READ_EVERY = 3600  # seconds
+
+KEY_COLUMN = 'Case #'
+# Rows in these states can still change upstream and are re-read on refresh
+OPEN_STATUSES = ('In Queue', 'In Progress')
+RENAMES = {'In process (On It SME)': 'SME (On It)'}
+
+# The worksheet's columns (after RENAMES), in sheet order
+SHEET_COLUMNS = ['Case #', 'Service', 'Inquiry', 'Requestor', 'Creation Timestamp',
+                 'SME (On It)', 'On It Time', 'Attendee', 'Attended Timestamp',
+                 'Message Link', 'Message Link 0', 'Message Link 1', 'Message Link 2',
+                 'Status', 'Case Reason', 'AFI', 'AFI Comment', 'Article#',
+                 'TimeTo: On It', 'TimeTo: Attended', 'Month', 'Day', 'Weekend?',
+                 'Date Created', 'Working Hours?', 'Survey', 'Hour_Created']
+# Needed by normalize and the incremental refresh, whatever the views declare
+REQUIRED_COLUMNS = [KEY_COLUMN, 'Service', 'Status', 'Date Created', 'TimeTo: On It', 'TimeTo: Attended']
+# Free text and extra links: only loaded when a table that shows them is opened
+HEAVY_COLUMNS = ['Inquiry', 'AFI Comment', 'Message Link 0', 'Message Link 1', 'Message Link 2']
+# Trailing rows hashed in full by fingerprint(); open cases live near the end of the sheet
+FINGERPRINT_ROWS = 500
+
+_declared_columns = {}
+
+
+def declare_columns(view, columns):
+    """Register the (normalized) sheet columns a view reads from the frame.
+
+    Call at import time; a declaration that widens the projection makes the
+    next ``get`` do a full read.
+    """
+    _declared_columns[view] = list(columns)
+
+
+def projected_columns():
+    columns = set(REQUIRED_COLUMNS)
+    for view_columns in _declared_columns.values():
+        columns.update(view_columns)
+    return frozenset(columns - set(HEAVY_COLUMNS))
+
+
+@timed('sheet.normalize', rows=len)
+def normalize(data):
+    """Shared ``load_data`` step: parse dates and durations, rename columns
+    and apply the typed schema from ``srr.schema``.
+
+    The duration strings are kept once, as read; the parsed seconds go in
+    the ``Sec`` columns beside them.
+
+    The index of ``data`` is kept so rows stay addressable by their position
+    in the sheet.
+    """
+    df = data.rename(columns=RENAMES)
+    df['Date Created'] = pd.to_datetime(df['Date Created'], errors='coerce')
+    df = df.dropna(subset=['Service'])
+    df['TimeTo: On It Sec'] = parse_duration_seconds(df['TimeTo: On It'])
+    df['TimeTo: Attended Sec'] = parse_duration_seconds(df['TimeTo: Attended'])
+    return apply_schema(df)
+
+
+def fingerprint(frame):
+    """Cheap content fingerprint of a normalized frame.
+
+    Row count and columns, a hash of the last ``FINGERPRINT_ROWS`` rows and
+    a hash of the whole ``Status`` column: appended rows, edits to recent
+    rows and status changes anywhere all change it.  Edits to older rows do
+    not, which is why only incremental refreshes are judged by it.
+    """
+    tail = pd.util.hash_pandas_object(frame.tail(FINGERPRINT_ROWS), index=True)
+    status = pd.util.hash_pandas_object(frame['Status'], index=False) if 'Status' in frame else tail[:0]
+    # uint64 sums wrap around, which is fine for a hash
+    return (len(frame), tuple(frame.columns), int(tail.sum()), int(status.sum()))
+
+
+def open_rows(frame):
+    return frame[frame['Status'].isin(OPEN_STATUSES)]
+
+
+def _same_key(a, b):
+    return (pd.isnull(a) and pd.isnull(b)) or a == b
+
+
+def _to_python(value):
+    # numpy scalars are not JSON serializable
+    return value.item() if hasattr(value, 'item') else value
+
+
+class SheetStore:
+    """TTL cache with single-flight, incremental refresh around a sheet reader.
+
+    ``read`` is called as ``read(**options)`` with pandas CSV parser options:
+    ``skiprows=range(1, start + 1)`` fetches sheet rows ``start`` onwards (the
+    header line is kept) and ``usecols`` selects the columns returned by the
+    ``columns`` callable, if one is given.  The held frame is indexed by sheet
+    row position, which is what lets a partial read be spliced back in.
+
+    An incremental refresh starts at the earliest row whose ``Status`` is
+    still open, or at the last row seen if nothing is open.  The last row
+    seen is always part of that window and its ``Case #`` must still match;
+    if it does not, rows were inserted or deleted upstream and the store
+    falls back to a full read.  Closed rows before the window are not
+    re-read, so the store also does a full read every ``full_every``
+    seconds and after ``invalidate(full=True)``.
+
+    The open rows are kept apart as well (``get_open``).  They all lie in that
+    refresh window, so they are picked out of the rows just read rather than
+    out of the whole history.
+
+    With a ``snapshot_path`` the store persists the frame after each refresh
+    and starts from the last snapshot: until the first refresh completes,
+    ``get`` returns the snapshot at once and refreshes in a background thread.
+    That first refresh is a full read.
+    """
+
+    def __init__(self, read, ttl=REFRESH_TTL, incremental=True, snapshot_path=None, columns=None,
+                 full_every=FULL_READ_EVERY):
+        self._read = read
+        self._columns = columns
+        self._projection = None
+        self.ttl = ttl
+        self.incremental = incremental
+        self.full_every = full_every
+        self.snapshot_path = snapshot_path
+        self._lock = threading.Lock()
+        self._frame = None
+        self._open = None
+        # (open rows, version) for the published frame
+        self._published_open = (None, 0)
+        # (frame, version) as handed to readers; replaced in one assignment
+        self._published = (None, 0)
+        self.version = 0
+        self.fingerprint = None
+        self.unchanged_fetches = 0
+        self._fetched_at = 0.0
+        # monotonic time of the last full read, None before the first
+        self._full_read_at = None
+        self._rows_seen = 0
+        self._last_key = None
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.full_reads = 0
+        self.incremental_reads = 0
+        self.heavy_reads = 0
+        self._heavy_lock = threading.Lock()
+        self._heavy = (None, 0)
+        self._serving_snapshot = False
+        # Guards _background only: _lock is held for a whole read, which
+        # requests served from the snapshot must not wait on
+        self._background_lock = threading.Lock()
+        self._background = None
+        if snapshot_path is not None:
+            self._warm_start()
+
+    def _warm_start(self):
+        snapshot = load_snapshot(self.snapshot_path)
+        if snapshot is None:
+            return
+        self._frame, meta = snapshot
+        self._open = open_rows(self._frame)
+        self._rows_seen = meta.get('rows_seen', 0)
+        self._last_key = meta.get('last_key')
+        projection = meta.get('projection')
+        self._projection = frozenset(projection) if projection is not None else None
+        self._serving_snapshot = True
+        # Closed rows in the snapshot may have been edited since it was written,
+        # and an incremental read would never revisit them: catch up in full
+        self._full_read_at = None
+        self._publish()
+
+    def _publish(self, force=False):
+        """Hand out ``_frame`` as a new version, unless its content is unchanged.
+
+        ``force`` publishes whatever the fingerprint says; a full read is the
+        only way edits to old rows (and to the heavy columns, re-read per
+        version) reach the published frame.  Returns whether a new version
+        was published.
+        """
+        new_fingerprint = fingerprint(self._frame)
+        if not force and new_fingerprint == self.fingerprint:
+            # Keep the published frame object too, so identity-keyed results stay valid
+            self._frame = self._published[0]
+            self._open = self._published_open[0]
+            self.unchanged_fetches += 1
+            return False
+        self.fingerprint = new_fingerprint
+        self.version += 1
+        self._published = (self._frame, self.version)
+        self._published_open = (self._open, self.version)
+        return True
+
+    def _wanted_columns(self):
+        return frozenset(self._columns()) if self._columns is not None else None
+
+    def _is_fresh(self):
+        return (
+            self._frame is not None
+            and self._wanted_columns() == self._projection
+            and time.monotonic() - self._fetched_at < self.ttl
+        )
+
+    def _read_options(self, projection):
+        if projection is None:
+            return {}
+        return {'usecols': lambda col: RENAMES.get(col, col) in projection}
+
+    def get(self):
+        """Return the cached frame, refreshing it first if it is stale."""
+        return self.get_versioned()[0]
+
+    @timed('sheet.get', cached=True)
+    def get_versioned(self):
+        """Like ``get`` but returns ``(frame, version)``.
+
+        The version changes whenever a new frame is published, so derived
+        results can be cached on it.
+        """
+        if self._is_fresh():
+            self.hits += 1
+            return self._published
+
+        if self._serving_snapshot and self._wanted_columns() == self._projection:
+            # Warm start: render from disk now, catch up off the request path
+            self.hits += 1
+            self._refresh_in_background()
+            return self._published
+
+        with self._lock:
+            # Another session may have refreshed while we waited on the lock
+            if self._is_fresh():
+                self.hits += 1
+                return self._published
+            self.misses += 1
+            self._refresh()
+            return self._published
+
+    def _refresh(self):
+        cache_miss()
+        full_reads = self.full_reads
+        wanted = self._wanted_columns()
+        if wanted != self._projection:
+            self._refresh_full(wanted)
+        elif self.incremental and self._rows_seen and not self._full_read_due():
+            self._refresh_incremental()
+        else:
+            self._refresh_full(self._projection)
+        self._fetched_at = time.monotonic()
+        self.fetches += 1
+        self._serving_snapshot = False
+        if self._publish(force=self.full_reads != full_reads) and self.snapshot_path is not None:
+            save_snapshot(self._frame, {
+                'rows_seen': self._rows_seen,
+                'last_key': _to_python(self._last_key),
+                'projection': sorted(self._projection) if self._projection is not None else None,
+            }, self.snapshot_path)
+
+    def _full_read_due(self):
+        return self._full_read_at is None or time.monotonic() - self._full_read_at >= self.full_every
+
+    def _refresh_in_background(self):
+        with self._background_lock:
+            if self._background is not None and self._background.is_alive():
+                return
+            self._background = threading.Thread(target=self._background_refresh, daemon=True)
+            self._background.start()
+
+    def _background_refresh(self):
+        with self._lock:
+            if self._is_fresh():
+                return
+            self.misses += 1
+            try:
+                self._refresh()
+            except Exception:
+                # Keep serving the snapshot; try again after another ttl
+                log.exception("Background refresh of the SRR sheet failed")
+                self._fetched_at = time.monotonic()
+
+    def _refresh_full(self, projection):
+        with section('sheet.read_full') as sample:
+            raw = self._read(**self._read_options(projection)).reset_index(drop=True)
+            sample['rows'] = len(raw)
+        frame = normalize(raw)
+        # Only now that the read succeeded: a failed read must leave the old
+        # projection in place, or the next refresh would read incrementally
+        # and fill the new columns for its window only
+        self.full_reads += 1
+        self._full_read_at = time.monotonic()
+        self._projection = projection
+        self._frame = frame
+        self._open = open_rows(self._frame)
+        self._rows_seen = len(raw)
+        self._last_key = raw[KEY_COLUMN].iloc[-1] if len(raw) else None
+
+    def _refresh_incremental(self):
+        anchor = self._rows_seen - 1
+        open_index = self._open.index
+        start = min(open_index.min(), anchor) if len(open_index) else anchor
+
+        with section('sheet.read_incremental') as sample:
+            delta = self._read(skiprows=range(1, start + 1), **self._read_options(self._projection))
+            sample['rows'] = len(delta)
+        delta = delta.set_axis(pd.RangeIndex(start, start + len(delta)))
+        if anchor not in delta.index or not _same_key(delta.at[anchor, KEY_COLUMN], self._last_key):
+            self._refresh_full(self._projection)
+            return
+
+        self.incremental_reads += 1
+        kept = self._frame[self._frame.index < start]
+        window = normalize(delta)
+        self._frame = concat_frames([kept, window])
+        self._open = open_rows(self._frame.loc[window.index])
+        self._rows_seen = start + len(delta)
+        self._last_key = delta[KEY_COLUMN].iloc[-1]
+
+    def get_open(self):
+        """Rows of ``get()`` whose ``Status`` is open, as ``(frame, version)``."""
+        frame, version = self.get_versioned()
+        rows, rows_version = self._published_open
+        if rows_version != version:
+            # A refresh published in between the two reads
+            rows = open_rows(frame)
+        return rows, version
+
+    def get_heavy(self):
+        """``HEAVY_COLUMNS`` for every sheet row, indexed like ``get()``.
+
+        Read on first use and again only after the main frame has changed.
+        """
+        version = self.get_versioned()[1]
+        with self._heavy_lock:
+            heavy, heavy_version = self._heavy
+            if heavy is None or heavy_version != version:
+                raw = self._read(usecols=lambda col: col in HEAVY_COLUMNS)
+                heavy = apply_schema(raw.reset_index(drop=True))
+                self._heavy = (heavy, version)
+                self.heavy_reads += 1
+            return heavy
+
+    def invalidate(self, full=False):
+        """Force the next ``get`` to go back to the sheet.
+
+        With ``full=True`` it re-reads the whole sheet rather than the
+        incremental window, picking up edits to closed rows.
+        """
+        with self._lock:
+            self._fetched_at = 0.0
+            if full:
+                self._rows_seen = 0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'fetches': self.fetches,
+            'full_reads': self.full_reads,
+            'incremental_reads': self.incremental_reads,
+            'heavy_reads': self.heavy_reads,
+            'rows': self._rows_seen,
+            'version': self.version,
+            'unchanged_fetches': self.unchanged_fetches,
+            'age_sec': time.monotonic() - self._fetched_at if self._frame is not None else None,
+        }
+
+
+@st.cache_resource(show_spinner=False)
+def get_store():
+    fixture = os.environ.get('SRR_FIXTURE')
+    if fixture:
+        def read(**options):
+            return pd.read_csv(fixture, **options)
+
+        # Kept apart: the committed fixture has the worksheet's name, and its rows
+        # must never be what a real start serves from SNAPSHOT_PATH
+        return SheetStore(read, snapshot_path=SNAPSHOT_DIR / 'fixture' / f"{Path(fixture).stem}.parquet",
+                          columns=projected_columns)
+
+    from streamlit_gsheets import GSheetsConnection
+
+    conn = st.connection("gsheets", type=GSheetsConnection)
+
+    def read(**options):
+        # ttl=0 bypasses the connection's own cache; the store owns freshness.
+        # Extra options go to the pandas/gspread CSV parser.
+        return conn.read(worksheet=WORKSHEET, ttl=0, **options)
+
+    return SheetStore(read, snapshot_path=SNAPSHOT_PATH, columns=projected_columns)
+
+
+def load_sheet():
+    """Return the shared, normalized SRR frame.
+
+    It is handed out without copying; under copy-on-write a caller that
+    assigns to it (or to a slice of it) gets its own copy of what it wrote.
+    """
+    return get_store().get()
+
+
+def with_heavy_columns(frame):
+    """``frame`` (any row subset of ``load_sheet()``) plus ``HEAVY_COLUMNS``."""
+    heavy = get_store().get_heavy()
+    return frame.join(heavy[[col for col in HEAVY_COLUMNS if col in heavy]])
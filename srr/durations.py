@@ -0,0 +1,74 @@
+"""Vectorized parsing of the sheet's ``H:MM:SS`` duration strings.
+
+The pages used to run ``convert_to_seconds`` row by row with
+``Series.apply`` and then parse the same strings again with
+``pd.to_timedelta``.  ``parse_duration_seconds`` does it once per column.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Optional "N day(s), " prefix as written by str(timedelta), then H:M:S.
+# Hours are unbounded, so "26:00:00" is also a multi-day value.
+_DURATION_PATTERN = (
+    r'^\s*(?:(?P<d>[+-]?\d+)\s+days?,?\s+)?'
+    r'(?P<h>[+-]?\d+)\s*:\s*(?P<m>[+-]?\d+)\s*:\s*(?P<s>[+-]?\d+)\s*$'
+)
+
+
+def parse_duration_seconds(values):
+    """Parse duration strings into an int64 Series of seconds.
+
+    Same contract as the old per-row ``convert_to_seconds``: nulls and
+    anything that is not ``H:M:S`` (optionally prefixed with ``N days``)
+    become 0.  Each distinct string is parsed once, so repeated durations
+    cost a hash lookup rather than a regex match.
+    """
+    values = pd.Series(values)
+    codes, uniques = pd.factorize(values)
+    if len(uniques) == 0:
+        return pd.Series(0, index=values.index, dtype='int64')
+
+    # As strings: a column read_csv inferred as numeric has no str values,
+    # and numbers never match H:M:S anyway
+    parts = pd.Series(np.asarray(uniques, dtype=object)).astype('string').str.extract(_DURATION_PATTERN)
+    parts = parts.apply(pd.to_numeric, errors='coerce')
+    seconds = (
+        parts['d'].fillna(0) * 86400
+        + parts['h'] * 3600
+        + parts['m'] * 60
+        + parts['s']
+    ).fillna(0).to_numpy(dtype='int64')
+
+    # factorize marks nulls with -1
+    result = np.where(codes >= 0, seconds[codes], 0)
+    return pd.Series(result, index=values.index, dtype='int64')
+
+
+NA_HMS = '--:--:--'
+
+
+def format_hms(seconds, na_rep=NA_HMS):
+    """Format a Series of seconds as ``HH:MM:SS`` strings in one pass.
+
+    Fractions are truncated like the old per-row ``seconds_to_hms``; NaN
+    (e.g. the mean of a group without timing data) becomes ``na_rep``
+    instead of raising.
+    """
+    seconds = pd.Series(seconds)
+    values = pd.to_numeric(seconds, errors='coerce').to_numpy(dtype='float64')
+    valid = np.isfinite(values)
+    total = np.floor(np.where(valid, values, 0)).astype('int64')
+
+    hours = pd.Series(total // 3600).astype(str).str.zfill(2)
+    minutes = pd.Series(total % 3600 // 60).astype(str).str.zfill(2)
+    secs = pd.Series(total % 60).astype(str).str.zfill(2)
+    formatted = (hours + ':' + minutes + ':' + secs).to_numpy(dtype=object)
+    formatted[~valid] = na_rep
+    return pd.Series(formatted, index=seconds.index, dtype=object)
+
+
+def seconds_to_hms(seconds):
+    """Scalar form of ``format_hms`` for metrics."""
+    return format_hms([seconds]).iloc[0]
@@ -0,0 +1,62 @@
+"""PygWalker explorer for the SRR Analytics Tool.
+
+``StreamlitRenderer(dataframe)`` used to be built on every rerun, hashing
+the frame and sending every row to the browser.  ``get_renderer`` keeps
+one renderer per session, rebuilt only when the data version or the mode
+changes.  The mode decides what PygWalker gets:
+
+* ``kernel``: all rows, with queries computed server side (DuckDB), so the
+  browser only receives the aggregated results it draws.  This is
+  PygWalker's default, and what the page always used;
+* ``sample``: a sample of ``SAMPLE_ROWS`` rows stratified by Service and
+  Month, computed in the browser;
+* ``all``: every row, computed in the browser.
+
+PygWalker routes a renderer's messages by its ``gid`` in a process-wide
+map, so the gid includes the session id: sessions never share one.
+
+Chart specs are read from and saved to ``gw_config.json``.
+"""
+
+import os
+from pathlib import Path
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+MODES = {
+    'kernel': "All rows, computed on the server",
+    'sample': "Stratified sample, computed in the browser",
+    'all': "All rows, computed in the browser",
+}
+DEFAULT_MODE = os.environ.get('SRR_GW_MODE', 'kernel')
+SAMPLE_ROWS = 20_000
+STRATA = ['Service', 'Month']
+SPEC_PATH = Path(__file__).resolve().parent.parent / 'gw_config.json'
+
+
+def stratified_sample(frame, n=SAMPLE_ROWS, by=STRATA, seed=0):
+    """About ``n`` rows of ``frame``, the same fraction from every ``by`` group."""
+    if len(frame) <= n:
+        return frame
+    by = [col for col in by if col in frame]
+    if not by:
+        return frame.sample(n, random_state=seed).sort_index()
+    return frame.groupby(by, observed=True, dropna=False).sample(frac=n / len(frame), random_state=seed).sort_index()
+
+
+def get_renderer(version, frame, mode=DEFAULT_MODE):
+    """This session's PygWalker renderer for ``frame`` at data ``version``."""
+    from pygwalker.api.streamlit import StreamlitRenderer
+
+    cached = st.session_state.get('gw_renderer')
+    if cached is not None and cached[:2] == (version, mode):
+        return cached[2]
+    dataset = stratified_sample(frame) if mode == 'sample' else frame
+    ctx = get_script_run_ctx()
+    session = ctx.session_id if ctx is not None else 'bare'
+    renderer = StreamlitRenderer(dataset, gid=f'srr-{session}-{mode}-{version}', spec=str(SPEC_PATH), spec_io_mode='rw',
+                                 kernel_computation=mode == 'kernel')
+    st.session_state['gw_renderer'] = (version, mode, renderer)
+    return renderer
@@ -0,0 +1,84 @@
+"""Download buttons whose files are built only when someone downloads them.
+
+``st.download_button`` used to be handed CSV bytes encoded on every rerun.
+``download_button`` passes it a callable instead, which Streamlit runs when
+the button is clicked.  The encoded payload is memoized per (view, filters,
+data version, format), so the next click on the same view does not encode
+it again, and a new version of the sheet makes a fresh one.
+
+Payloads are written in chunks of ``CHUNK_ROWS`` rows, so the gzip variant
+never holds the whole uncompressed CSV in memory.
+"""
+
+import gzip
+import io
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from srr.data import get_store
+
+
+CHUNK_ROWS = 10_000
+MAX_PAYLOADS = 16
+
+FORMATS = {
+    'csv': ('.csv', 'text/csv'),
+    'csv.gz': ('.csv.gz', 'application/gzip'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'xlsx': ('.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+_payloads = OrderedDict()
+_lock = threading.Lock()
+
+
+def encode(frame, fmt='csv'):
+    """``frame`` (without its index) as the bytes of a ``fmt`` file."""
+    buffer = io.BytesIO()
+    if fmt == 'csv':
+        text = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+        frame.to_csv(text, index=False, chunksize=CHUNK_ROWS)
+        text.flush()
+        text.detach()  # keep the buffer open
+    elif fmt == 'csv.gz':
+        with gzip.GzipFile(fileobj=buffer, mode='wb') as gz:
+            with io.TextIOWrapper(gz, encoding='utf-8', newline='') as text:
+                frame.to_csv(text, index=False, chunksize=CHUNK_ROWS)
+    elif fmt == 'parquet':
+        frame.to_parquet(buffer, index=False)
+    elif fmt == 'xlsx':
+        frame.to_excel(buffer, index=False)
+    else:
+        raise ValueError(f"Unknown export format: {fmt!r}")
+    return buffer.getvalue()
+
+
+def payload(key, build, fmt='csv'):
+    """Encoded ``build()`` for ``key``, kept for the ``MAX_PAYLOADS`` latest keys."""
+    key = key + (fmt,)
+    with _lock:
+        if key in _payloads:
+            _payloads.move_to_end(key)
+            return _payloads[key]
+    data = encode(build(), fmt)
+    with _lock:
+        _payloads[key] = data
+        while len(_payloads) > MAX_PAYLOADS:
+            _payloads.popitem(last=False)
+    return data
+
+
+def download_button(label, data, file_name, view, filters=(), fmt='csv', **kwargs):
+    """``st.download_button`` for ``data``, a frame or a callable returning one.
+
+    ``view`` and ``filters`` (hashable) identify what ``data`` shows; with the
+    store's version they key the memoized payload.  ``file_name`` is given
+    without an extension.
+    """
+    version = get_store().get_versioned()[1]
+    build = data if callable(data) else (lambda: data)
+    suffix, mime = FORMATS[fmt]
+    return st.download_button(label, lambda: payload((view, filters, version), build, fmt),
+                              file_name=file_name + suffix, mime=mime, **kwargs)
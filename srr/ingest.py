@@ -0,0 +1,110 @@
+"""Chunked ingestion of a long SRR history export.
+
+``SheetStore`` holds the whole worksheet in memory.  For a multi-year
+export (CSV or Parquet) ``ingest`` reads it ``BATCH_ROWS`` rows at a time,
+normalizes each batch as the store does, and folds it into a
+``CubeAccumulator``.  Peak memory is one batch plus the cube, however long
+the history; the result is the cube ``build_cube`` gives for the whole
+frame, plus the rows that are still open.
+
+Build the cube of an export with::
+
+    python -m srr.ingest history.csv --out cube.parquet
+
+This is an offline tool: nothing in the app reads ``cube.parquet``.  The
+dashboards still build their cube from ``SheetStore``'s in-memory frame,
+so it does not bound the app's memory.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from srr.cube import CUBE_COLUMNS, DIMENSIONS, MEASURES, build_cube
+from srr.data import RENAMES, REQUIRED_COLUMNS, normalize, open_rows
+from srr.schema import concat_frames
+
+
+BATCH_ROWS = 50_000
+# What normalize and the cube need; the free text is never read
+INGEST_COLUMNS = frozenset(REQUIRED_COLUMNS + CUBE_COLUMNS)
+
+
+def iter_batches(path, batch_rows=BATCH_ROWS, columns=INGEST_COLUMNS):
+    """Raw sheet rows of a CSV or Parquet export, ``batch_rows`` at a time.
+
+    ``columns`` (normalized names, or None for all) limits the columns
+    read.  Batches are indexed by row position in the export, like the
+    store's frame.
+    """
+    path = Path(path)
+    wanted = None if columns is None else (lambda col: RENAMES.get(col, col) in columns)
+    if path.suffix == '.parquet':
+        parquet = pq.ParquetFile(path)
+        names = [col for col in parquet.schema_arrow.names if wanted is None or wanted(col)]
+        start = 0
+        for batch in parquet.iter_batches(batch_size=batch_rows, columns=names):
+            frame = batch.to_pandas()
+            yield frame.set_axis(pd.RangeIndex(start, start + len(frame)))
+            start += len(frame)
+    else:
+        # read_csv's chunks already carry on the row numbering
+        yield from pd.read_csv(path, chunksize=batch_rows, usecols=wanted)
+
+
+class CubeAccumulator:
+    """``build_cube`` over a frame that arrives in batches.
+
+    Each batch is reduced to a partial cube at once; partials are merged
+    every ``merge_every`` batches, so only the cube-sized results are kept.
+    """
+
+    def __init__(self, merge_every=8):
+        self.merge_every = merge_every
+        self.rows = 0
+        self._parts = []
+
+    def add(self, frame):
+        self._parts.append(build_cube(frame))
+        self.rows += len(frame)
+        if len(self._parts) >= self.merge_every:
+            self._parts = [self.cube()]
+
+    def cube(self):
+        if not self._parts:
+            return pd.DataFrame(columns=DIMENSIONS + MEASURES)
+        if len(self._parts) == 1:
+            return self._parts[0]
+        # Same grouping as build_cube, now summing the partial measures
+        merged = concat_frames(self._parts)
+        return merged.groupby(DIMENSIONS, dropna=False, observed=True, sort=False)[MEASURES].sum().reset_index()
+
+
+def ingest(path, batch_rows=BATCH_ROWS, columns=INGEST_COLUMNS):
+    """Cube, open rows and row count of the export at ``path``, read in batches."""
+    cubes = CubeAccumulator()
+    open_parts = []
+    for raw in iter_batches(path, batch_rows, columns):
+        batch = normalize(raw)
+        cubes.add(batch)
+        open_parts.append(open_rows(batch))
+    open_frame = concat_frames(open_parts) if open_parts else None
+    return cubes.cube(), open_frame, cubes.rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', help="CSV or Parquet export of the worksheet")
+    parser.add_argument('--batch-rows', type=int, default=BATCH_ROWS)
+    parser.add_argument('--out', help="write the cube to this Parquet file")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    cube, open_frame, rows = ingest(args.path, args.batch_rows)
+    print(f"{rows:,} rows -> {len(cube):,} cube rows, {len(open_frame) if open_frame is not None else 0} open "
+          f"in {time.perf_counter() - started:.1f} s")
+    if args.out:
+        cube.to_parquet(args.out, index=False)
@@ -0,0 +1,65 @@
+"""Live queue status: the In Queue / In Progress cases and their counts.
+
+The wall monitor only needs the open cases.  The store keeps those apart
+from the history (``SheetStore.get_open``), picking them out of each
+incremental refresh window, so the views here cost the same however long
+the sheet gets.
+
+``pages/5_Live_Queue.py`` shows them on their own; with ``?format=json`` it
+shows ``live_status()`` as a JSON tree instead.  That is still a Streamlit
+page, drawn over its websocket: it is for reading in the browser, not an
+HTTP endpoint that scripts can fetch (Streamlit has no custom routes).
+"""
+
+import json
+
+import streamlit as st
+
+from srr.data import REFRESH_TTL, declare_columns, get_store
+
+
+IN_QUEUE_COLUMNS = ['Case #', 'Requestor', 'Service', 'Creation Timestamp', 'Message Link']
+IN_PROGRESS_COLUMNS = ['Case #', 'Requestor', 'Service', 'Creation Timestamp', 'SME (On It)', 'TimeTo: On It', 'Message Link']
+
+declare_columns('live', IN_PROGRESS_COLUMNS + ['Status'])
+
+
+def load_open():
+    """The open rows of the shared frame. Callers must not mutate it."""
+    return get_store().get_open()[0]
+
+
+def queues(frame):
+    """DataFrames for "In Queue" and "In Progress" out of the open rows in ``frame``."""
+    df_inqueue = frame.loc[frame['Status'] == 'In Queue', IN_QUEUE_COLUMNS]
+    df_inprogress = frame.loc[frame['Status'] == 'In Progress', IN_PROGRESS_COLUMNS]
+    return df_inqueue, df_inprogress
+
+
+def live_status():
+    """Counts and rows of both queues as a JSON-ready dict."""
+    frame, version = get_store().get_open()
+    df_inqueue, df_inprogress = queues(frame)
+    return {
+        'version': version,
+        'counts': {'In Queue': len(df_inqueue), 'In Progress': len(df_inprogress)},
+        # to_json turns missing values into null and timestamps into strings
+        'In Queue': json.loads(df_inqueue.to_json(orient='records')),
+        'In Progress': json.loads(df_inprogress.to_json(orient='records')),
+    }
+
+
+@st.fragment(run_every=REFRESH_TTL)
+def show_live():
+    df_inqueue, df_inprogress = queues(load_open())
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("In Queue", len(df_inqueue))
+    with col2:
+        st.metric("In Progress", len(df_inprogress))
+
+    st.subheader('In Queue')
+    st.dataframe(df_inqueue, use_container_width=True, hide_index=True)
+    st.subheader('In Progress')
+    st.dataframe(df_inprogress, use_container_width=True, hide_index=True)
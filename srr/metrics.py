@@ -0,0 +1,154 @@
+"""Timings of the named sections of a rerun, across all sessions.
+
+Wrap a section in ``section(name)`` (or decorate a function with
+``timed(name)``) to record its wall time, and optionally the rows it
+processed and whether it was served from a cache.  A cached section
+(``cached=True``) counts as a hit unless ``cache_miss()`` is called while
+it runs, which the builder behind the cache does.
+
+The last ``WINDOW`` samples of each section are kept per process, so
+``summary`` covers every session the worker serves.  Each sample is also
+logged as one JSON object on the ``srr.metrics`` logger at INFO, written
+to stderr one line per sample; ``SRR_METRICS_LOG`` sets the logger's level
+(``WARNING`` silences it).
+``show_admin`` renders the summary; the entry page shows it instead of
+the dashboard for ``?admin=<SRR_ADMIN_TOKEN>``.
+"""
+
+import functools
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+log = logging.getLogger(__name__)
+if not log.handlers:
+    # Streamlit only configures its own loggers; without a handler the samples would go nowhere
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(_handler)
+    log.propagate = False
+log.setLevel(os.environ.get('SRR_METRICS_LOG', 'INFO').upper())
+
+WINDOW = 1000  # samples kept per section
+ADMIN_TOKEN = os.environ.get('SRR_ADMIN_TOKEN')
+
+_lock = threading.Lock()
+_samples = {}
+_local = threading.local()
+
+
+def _active():
+    # Sections running in this thread, innermost last
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def _session_id():
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+def _record(sample):
+    with _lock:
+        _samples.setdefault(sample['section'], deque(maxlen=WINDOW)).append(
+            (sample['seconds'], sample['rows'], sample['cache']))
+    if log.isEnabledFor(logging.INFO):
+        log.info(json.dumps(sample, default=str))
+
+
+@contextmanager
+def section(name, rows=None, cached=False):
+    """Time the ``with`` block as section ``name``.
+
+    Yields the sample dict; set ``sample['rows']`` inside the block when the
+    row count is only known there.
+    """
+    sample = {'section': name, 'rows': rows, 'cache': 'hit' if cached else None, 'session': _session_id()}
+    stack = _active()
+    stack.append(sample)
+    started = time.perf_counter()
+    try:
+        yield sample
+    finally:
+        sample['seconds'] = time.perf_counter() - started
+        stack.pop()
+        _record(sample)
+
+
+def cache_miss():
+    """Mark the innermost cached section running in this thread as a miss."""
+    for sample in reversed(_active()):
+        if sample['cache'] is not None:
+            sample['cache'] = 'miss'
+            return
+
+
+def timed(name, rows=None, cached=False):
+    """Decorator form of ``section``; ``rows`` maps the result to its row count."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with section(name, cached=cached) as sample:
+                result = func(*args, **kwargs)
+                if rows is not None:
+                    sample['rows'] = rows(result)
+                return result
+        return wrapper
+    return decorate
+
+
+def summary():
+    """Calls, p50/p95/max milliseconds, mean rows and hit rate per section."""
+    with _lock:
+        samples = {name: list(values) for name, values in _samples.items()}
+    rows = []
+    for name, values in sorted(samples.items()):
+        seconds = np.array([v[0] for v in values]) * 1000
+        counted = [v[1] for v in values if v[1] is not None]
+        cache = [v[2] for v in values if v[2] is not None]
+        rows.append({
+            'Section': name,
+            'Calls': len(values),
+            'p50 ms': np.percentile(seconds, 50),
+            'p95 ms': np.percentile(seconds, 95),
+            'Max ms': seconds.max(),
+            'Mean rows': np.mean(counted) if counted else None,
+            'Hit rate': cache.count('hit') / len(cache) if cache else None,
+        })
+    columns = ['Section', 'Calls', 'p50 ms', 'p95 ms', 'Max ms', 'Mean rows', 'Hit rate']
+    return pd.DataFrame(rows, columns=columns).set_index('Section')
+
+
+def reset():
+    with _lock:
+        _samples.clear()
+
+
+def admin_requested():
+    """Whether the page was opened with ``?admin=`` and the right token."""
+    token = st.query_params.get('admin')
+    return bool(ADMIN_TOKEN) and token is not None and hmac.compare_digest(token, ADMIN_TOKEN)
+
+
+def show_admin():
+    from srr.data import get_store
+
+    st.title("SRR Timings")
+    st.caption(f"Last {WINDOW} samples per section in this worker, across all sessions.")
+    if st.button("Reset"):
+        reset()
+    st.dataframe(summary().sort_values('p95 ms', ascending=False), use_container_width=True)
+    st.subheader("Sheet store")
+    st.json(get_store().stats())
@@ -0,0 +1,77 @@
+"""Column profile for the EDA section of the SRR Analytics Tool.
+
+``perform_eda`` used to run ``isnull()`` twice, ``duplicated`` twice per
+column and a separate ``describe(include='all')`` on every rerun.  Here
+each column is factorized once; null, distinct and duplicate counts and
+the top value all come from those codes, and the codes stay in the
+profile so the "view Nulls" / "view duplicates" selectboxes only index
+rows that are already profiled.  ``load_profile`` keeps one profile per
+data version.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+
+
+STATS = ['count', 'unique', 'top', 'freq', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+def _column_profile(values):
+    codes, uniques = pd.factorize(values)  # missing values get code -1
+    # The codes stay in the cached profile: the smallest signed int that holds them, not int64
+    codes = codes.astype(np.min_scalar_type(-max(len(uniques), 1)))
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=len(uniques))
+    count = int(valid.sum())
+    nulls = len(values) - count
+    summary = {'count': count}
+    if is_numeric_dtype(values.dtype) and not is_bool_dtype(values.dtype) or is_datetime64_any_dtype(values.dtype):
+        summary.update(values.describe().drop('count').to_dict())
+    elif len(uniques):
+        top = counts.argmax()
+        summary.update(unique=len(uniques), top=uniques[top], freq=int(counts[top]))
+    else:
+        summary.update(unique=0)
+    return {
+        'codes': codes,
+        'counts': counts,
+        'nulls': nulls,
+        'unique': len(uniques),
+        # duplicated(subset=[col]).sum(): every repeat of a value, missing included
+        'duplicates': len(values) - len(uniques) - (1 if nulls else 0),
+        'summary': summary,
+    }
+
+
+def profile(frame):
+    """Per-column profile of ``frame``; see ``null_rows`` / ``duplicate_rows``."""
+    columns = {col: _column_profile(frame[col]) for col in frame.columns}
+    return {
+        'columns': columns,
+        'dtypes': pd.DataFrame(frame.dtypes, columns=["Data Type"]).rename_axis("Column"),
+        'nulls': pd.Series({col: p['nulls'] for col, p in columns.items()}, dtype='int64'),
+        'unique': pd.Series({col: p['unique'] for col, p in columns.items()}, dtype='int64'),
+        'duplicates': pd.Series({col: p['duplicates'] for col, p in columns.items()}, dtype='int64'),
+        'describe': pd.DataFrame({col: p['summary'] for col, p in columns.items()}).reindex(STATS).dropna(how='all'),
+    }
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_profile(version, _frame):
+    """``profile`` of ``_frame``, computed once per data version."""
+    return profile(_frame)
+
+
+def null_rows(frame, prof, col):
+    """Rows of ``frame`` (the profiled frame) where ``col`` is missing."""
+    return frame[prof['columns'][col]['codes'] < 0]
+
+
+def duplicate_rows(frame, prof, col):
+    """Rows of ``frame`` whose ``col`` value occurs more than once, as duplicated(keep=False)."""
+    p = prof['columns'][col]
+    # Code -1 (missing) picks the null count at the end
+    occurrences = np.append(p['counts'], p['nulls'])[p['codes']]
+    return frame[occurrences > 1]
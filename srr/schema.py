@@ -0,0 +1,76 @@
+"""Column dtypes for the normalized SRR frame.
+
+The sheet arrives as Python object columns full of repeated strings.
+``apply_schema`` gives every known column a compact dtype:
+
+* low-cardinality labels become categoricals, which also makes the cube's
+  groupbys and the ``==``/``isin`` filters work on integer codes;
+* Yes/No flags become nullable booleans (``flags_as_text`` turns them back
+  into Yes/No for display and export);
+* free text and URLs become Arrow-backed strings;
+* ``Hour_Created`` is an ``Int8``, ``Survey`` a ``float32`` and the parsed
+  durations ``int32`` seconds.
+
+Columns not listed are left alone, so new sheet columns still load.
+"""
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+
+CATEGORICAL = ['Service', 'Requestor', 'SME (On It)', 'Attendee', 'Status', 'Case Reason', 'Month', 'Day', 'AFI']
+FLAGS = ['Weekend?', 'Working Hours?']
+TEXT = ['Inquiry', 'AFI Comment', 'Article#', 'Message Link', 'Message Link 0', 'Message Link 1', 'Message Link 2',
+        'Creation Timestamp', 'On It Time', 'Attended Timestamp', 'TimeTo: On It', 'TimeTo: Attended']
+SECONDS = ['TimeTo: On It Sec', 'TimeTo: Attended Sec']
+
+_FLAG_VALUES = {'Yes': True, 'No': False}
+_FLAG_TEXT = {value: text for text, value in _FLAG_VALUES.items()}
+
+
+def apply_schema(df):
+    columns = {}
+    for col in CATEGORICAL:
+        if col in df:
+            columns[col] = df[col].astype('category')
+    for col in FLAGS:
+        if col in df:
+            columns[col] = df[col].map(_FLAG_VALUES).astype('boolean')
+    for col in TEXT:
+        if col in df:
+            # Blank cells stay missing rather than becoming the string 'nan'
+            columns[col] = df[col].astype('string[pyarrow]')
+    if 'Hour_Created' in df:
+        columns['Hour_Created'] = pd.to_numeric(df['Hour_Created'], errors='coerce').astype('Int8')
+    if 'Survey' in df:
+        columns['Survey'] = pd.to_numeric(df['Survey'], errors='coerce').astype('float32')
+    for col in SECONDS:
+        if col in df:
+            columns[col] = df[col].astype('int32')
+    return df.assign(**columns)
+
+
+def flags_as_text(df):
+    """``df`` with its ``FLAGS`` columns as the sheet's Yes/No strings again."""
+    return df.assign(**{col: df[col].map(_FLAG_TEXT).astype('string[pyarrow]') for col in FLAGS if col in df})
+
+
+def concat_frames(frames):
+    """``pd.concat`` that keeps categoricals categorical.
+
+    Plain concat falls back to object when the parts' categories differ,
+    as they do whenever new rows bring a new Service or SME.
+    """
+    frames = list(frames)
+    for col in CATEGORICAL:
+        # An all-blank part has no categories, and they are not even of the right dtype
+        parts = [f[col] for f in frames
+                 if col in f and isinstance(f[col].dtype, pd.CategoricalDtype) and len(f[col].cat.categories)]
+        if not parts:
+            continue
+        categories = union_categoricals(parts, ignore_order=True).categories
+        frames = [
+            f.assign(**{col: f[col].cat.set_categories(categories)}) if col in f else f
+            for f in frames
+        ]
+    return pd.concat(frames)
@@ -0,0 +1,59 @@
+"""On-disk Parquet snapshot of the normalized SRR frame.
+
+A fresh worker or a restarted container has an empty process cache, so
+without a snapshot the first viewer waits on a full Google Sheets read.
+``SheetStore`` writes the frame here after every refresh and, on startup,
+serves it immediately while a background refresh catches up.
+
+The store's bookkeeping (rows seen, last ``Case #``) travels in the Parquet
+schema metadata.  The catch-up is still a full read: closed rows may have
+been edited upstream since the snapshot was written.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path(os.environ.get('SRR_SNAPSHOT_DIR', Path(__file__).resolve().parent.parent / '.srr_cache'))
+SNAPSHOT_PATH = SNAPSHOT_DIR / 'response_and_survey_form.parquet'
+_META_KEY = b'srr'
+
+
+def save_snapshot(frame, meta, path=SNAPSHOT_PATH):
+    """Write ``frame`` and the ``meta`` dict atomically. Returns True on success."""
+    path = Path(path)
+    try:
+        table = pa.Table.from_pandas(frame)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_META_KEY] = json.dumps(meta, default=str).encode()
+        table = table.replace_schema_metadata(metadata)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+    except (pa.ArrowException, OSError) as exc:
+        # Mixed-type object columns cannot be stored; the app works without a snapshot
+        log.warning("Could not write SRR snapshot to %s: %s", path, exc)
+        return False
+    return True
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """Return ``(frame, meta)`` from the last snapshot, or ``None``."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        table = pq.read_table(path)
+    except (pa.ArrowException, OSError) as exc:
+        log.warning("Ignoring unreadable SRR snapshot %s: %s", path, exc)
+        return None
+    meta = json.loads((table.schema.metadata or {}).get(_META_KEY, b'{}'))
+    return table.to_pandas(), meta
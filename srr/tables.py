@@ -0,0 +1,89 @@
+"""Paged tables: only the visible page of rows is sent to the browser.
+
+``st.dataframe`` serializes the whole frame it is given on every rerun.
+``paged_table`` keeps search, sort and paging on the server and hands
+``st.dataframe`` one page at a time, so the payload stays the same size as
+the history grows.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+PAGE_SIZE = 50
+
+
+def search(frame, query):
+    """Rows of ``frame`` where any column contains ``query`` (case-insensitive)."""
+    query = query.strip()
+    if not query:
+        return frame
+    mask = np.zeros(len(frame), dtype=bool)
+    for col in frame.columns:
+        values = frame[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Match the categories once, then the rows by code
+            hits = values.cat.categories.astype('string').str.contains(query, case=False, regex=False)
+            mask |= values.cat.codes.isin(np.flatnonzero(hits)).to_numpy()
+        else:
+            mask |= values.astype('string').str.contains(query, case=False, regex=False).fillna(False).to_numpy(dtype=bool)
+    return frame[mask]
+
+
+def page_index(frame, sort_by=None, ascending=True, page=1, page_size=PAGE_SIZE):
+    """Index labels of rows ``(page - 1) * page_size`` onwards of ``frame`` sorted by ``sort_by``.
+
+    Only the sort column is sorted; the rows themselves are not reordered.
+    """
+    index = frame.index if sort_by is None else frame[sort_by].sort_values(ascending=ascending, kind='stable').index
+    start = (page - 1) * page_size
+    return index[start:start + page_size]
+
+
+def _first_page(key):
+    st.session_state[f'{key}_page'] = 1
+
+
+def _show_dataframe(rows):
+    st.dataframe(rows, use_container_width=True)
+
+
+def paged_table(frame, key, render=None, show=_show_dataframe, page_size=PAGE_SIZE, expand=None):
+    """Search box, sort controls and one page of ``frame``.
+
+    ``render`` maps the rows of the visible page to the frame displayed, e.g.
+    to join in extra columns or relabel them; search and sort see ``frame``.
+    ``expand`` joins columns that ``frame`` leaves out (e.g.
+    ``with_heavy_columns``) so they can be searched and sorted too; it is
+    applied to every row only while a query or a sort on those columns is
+    set.  ``show`` displays that page; by default with ``st.dataframe``.
+    """
+    extra = [col for col in expand(frame.iloc[:0]).columns if col not in frame] if expand is not None else []
+    col1, col2, col3 = st.columns([2, 1, 0.5])
+    with col1:
+        query = st.text_input('Search', key=f'{key}_search', on_change=_first_page, args=(key,))
+    with col2:
+        sort_by = st.selectbox('Sort by', [None] + list(frame.columns) + extra, key=f'{key}_sort',
+                               format_func=lambda col: '(default order)' if col is None else col,
+                               on_change=_first_page, args=(key,))
+    with col3:
+        descending = st.toggle('Descending', key=f'{key}_desc', on_change=_first_page, args=(key,))
+
+    searched = expand(frame) if extra and (query.strip() or sort_by in extra) else frame
+    matches = search(searched, query)
+    pages = max(1, math.ceil(len(matches) / page_size))
+    if st.session_state.get(f'{key}_page', 1) > pages:
+        st.session_state[f'{key}_page'] = pages
+
+    # render gets the rows as they are in frame
+    rows = frame.loc[page_index(matches, sort_by, not descending, st.session_state.get(f'{key}_page', 1), page_size)]
+    show(render(rows) if render is not None else rows)
+
+    col1, col2 = st.columns([0.5, 2])
+    with col1:
+        st.number_input('Page', min_value=1, max_value=pages, step=1, key=f'{key}_page')
+    with col2:
+        st.caption(f'{len(matches):,} rows, page size {page_size}')
@@ -0,0 +1,191 @@
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from srr.data import OPEN_STATUSES, SheetStore
+
+FIXTURE = Path(__file__).resolve().parent.parent / 'fixtures' / 'response_and_survey_form.csv'
+
+
+def make_sheet(rows):
+    """The fixture sheet tiled to ``rows`` rows; only the last few cases are open."""
+    sheet = pd.read_csv(FIXTURE)
+    sheet = sheet.iloc[np.arange(rows) % len(sheet)].reset_index(drop=True)
+    sheet['Case #'] = np.arange(1001, 1001 + rows)
+    old = sheet.index < rows - len(pd.read_csv(FIXTURE))
+    sheet.loc[old & sheet['Status'].isin(OPEN_STATUSES), 'Status'] = 'Resolved'
+    return sheet
+
+
+class FakeSheet:
+    """A ``read`` callable over an in-memory sheet, honouring skiprows and usecols."""
+
+    def __init__(self, rows):
+        self.frame = make_sheet(rows)
+        self.reads = []
+
+    def read(self, skiprows=None, usecols=None):
+        self.reads.append({'skiprows': skiprows, 'usecols': usecols})
+        frame = self.frame
+        if skiprows is not None:
+            # skiprows=range(1, start + 1) keeps the header and drops data rows 0..start-1
+            frame = frame.iloc[len(skiprows):]
+        if usecols is not None:
+            frame = frame[[col for col in frame.columns if usecols(col)]]
+        return frame.reset_index(drop=True)
+
+
+@pytest.fixture
+def sheet():
+    return FakeSheet(1600)
+
+
+def make_store(sheet, columns=None):
+    # A long ttl: tests refresh explicitly with invalidate()
+    return SheetStore(sheet.read, ttl=3600, columns=columns)
+
+
+def test_full_read_picks_up_edit_to_old_closed_row(sheet):
+    store = make_store(sheet)
+    frame, version = store.get_versioned()
+    assert frame['Status'].iloc[0] == 'Resolved'
+
+    sheet.frame.loc[0, 'Survey'] = 1
+    store.invalidate(full=True)
+    frame, new_version = store.get_versioned()
+
+    assert frame['Survey'].iloc[0] == 1
+    assert new_version > version
+
+
+def test_full_read_refreshes_heavy_columns(sheet):
+    store = make_store(sheet, columns=lambda: ['Case #', 'Service', 'Status', 'Date Created',
+                                               'TimeTo: On It', 'TimeTo: Attended'])
+    assert 'Inquiry' not in store.get()
+    store.get_heavy()
+
+    sheet.frame.loc[0, 'Inquiry'] = 'edited'
+    store.invalidate(full=True)
+    store.get()
+
+    assert store.get_heavy().loc[0, 'Inquiry'] == 'edited'
+
+
+def test_snapshot_requests_do_not_wait_on_catch_up(sheet, tmp_path):
+    path = tmp_path / 'snapshot.parquet'
+    SheetStore(sheet.read, ttl=3600, snapshot_path=path).get()
+
+    def slow_read(**options):
+        time.sleep(1)
+        return sheet.read(**options)
+
+    store = SheetStore(slow_read, ttl=3600, snapshot_path=path)
+    store.get()
+    # Let the catch-up start its read
+    time.sleep(0.1)
+    started = time.perf_counter()
+    store.get()
+    assert time.perf_counter() - started < 0.5
+    store._background.join()
+
+
+def append_rows(sheet, n):
+    new = sheet.frame.iloc[:n].copy()
+    new['Case #'] = sheet.frame['Case #'].max() + 1 + np.arange(n)
+    sheet.frame = pd.concat([sheet.frame, new], ignore_index=True)
+
+
+def test_append_is_read_incrementally(sheet):
+    store = make_store(sheet)
+    rows, version = len(store.get()), store.version
+
+    append_rows(sheet, 5)
+    store.invalidate()
+    frame = store.get()
+
+    assert len(frame) == rows + 5
+    assert frame['Case #'].tolist() == sheet.frame['Case #'].tolist()
+    assert store.incremental_reads == 1 and store.full_reads == 1
+    assert sheet.reads[-1]['skiprows'] is not None
+    assert store.version == version + 1
+
+
+def test_status_change_of_open_case(sheet):
+    store = make_store(sheet)
+    open_before = store.get_open()[0]
+    assert len(open_before)
+
+    row = open_before.index[0]
+    sheet.frame.loc[row, 'Status'] = 'Resolved'
+    store.invalidate()
+    frame = store.get()
+
+    assert frame.loc[row, 'Status'] == 'Resolved'
+    assert row not in store.get_open()[0].index
+    assert len(store.get_open()[0]) == len(open_before) - 1
+    assert store.incremental_reads == 1
+
+
+def test_upstream_insertion_falls_back_to_full_read(sheet):
+    store = make_store(sheet)
+    store.get()
+
+    inserted = sheet.frame.iloc[[0]].assign(**{'Case #': 999})
+    sheet.frame = pd.concat([sheet.frame.iloc[:10], inserted, sheet.frame.iloc[10:]], ignore_index=True)
+    store.invalidate()
+    frame = store.get()
+
+    assert store.full_reads == 2 and store.incremental_reads == 0
+    assert frame['Case #'].tolist() == sheet.frame['Case #'].tolist()
+
+
+def test_old_row_edit_needs_full_refresh(sheet):
+    store = make_store(sheet)
+    store.get()
+
+    sheet.frame.loc[0, 'Case Reason'] = 'Edited'
+    # Closed rows before the refresh window are not re-read incrementally...
+    store.invalidate()
+    assert store.get().loc[0, 'Case Reason'] != 'Edited'
+    # ...but a full refresh (the Refresh Data button) picks the edit up
+    store.invalidate(full=True)
+    assert store.get().loc[0, 'Case Reason'] == 'Edited'
+
+
+def test_projection_widening_reads_new_column_in_full(sheet):
+    columns = ['Case #', 'Service', 'Status', 'Date Created', 'TimeTo: On It', 'TimeTo: Attended']
+    store = make_store(sheet, columns=lambda: columns)
+    assert 'Requestor' not in store.get()
+
+    columns.append('Requestor')
+    frame = store.get()
+
+    assert frame['Requestor'].notna().all()
+    assert store.full_reads == 2
+
+
+def test_failed_widening_read_is_retried_in_full(sheet):
+    columns = ['Case #', 'Service', 'Status', 'Date Created', 'TimeTo: On It', 'TimeTo: Attended']
+    read = sheet.read
+    failures = []
+
+    def flaky_read(**options):
+        if failures:
+            failures.pop()
+            raise OSError("sheet unavailable")
+        return read(**options)
+
+    store = SheetStore(flaky_read, ttl=3600, columns=lambda: columns)
+    store.get()
+
+    columns.append('Requestor')
+    failures.append(True)
+    with pytest.raises(OSError):
+        store.get()
+    frame = store.get()
+
+    assert frame['Requestor'].notna().all()
+    assert store.incremental_reads == 0